@@ -1,5 +1,6 @@
 # Configuration file for the Sphinx documentation builder.
-from typing import List
+import pickle  # nosec B403 - only used to check config values can be cached
+from typing import Any, Dict, List
 
 # -- Project information -----------------------------------------------------
 project = "Python CI/CD Demo"
@@ -46,3 +47,32 @@ myst_enable_extensions = [
 
 # Mermaid support
 myst_fence_as_directive = ["mermaid"]
+
+# -- Environment cache -------------------------------------------------------
+# Sphinx pickles config values into its environment cache and rebuilds every
+# page when a value cannot be pickled. Keep every config value picklable
+# (no functions, classes or modules as values) to preserve incremental builds.
+suppress_warnings = ["config.cache"]
+html_context: Dict[str, Any] = {}
+
+
+def _check_config_picklable(app: Any, config: Any) -> None:
+    """Fail early if a config value set in this file cannot be pickled."""
+    # Only registered config values reach the cache; helper imports, classes
+    # and functions defined in this file are not config values
+    conf_names = globals()
+    for option in config:
+        if option.name not in conf_names:
+            continue
+        try:
+            pickle.dumps(option.value)
+        except Exception as exc:
+            raise RuntimeError(
+                f"Sphinx config value {option.name!r} must be picklable to keep "
+                f"the environment cache: {exc}"
+            ) from exc
+
+
+def setup(app: Any) -> None:
+    """Register the config pickle check."""
+    app.connect("config-inited", _check_config_picklable)
@@ -22,24 +22,281 @@ Options:
     --title TEXT           Badge title text (default: coverage)
     --min-good N          Minimum percentage for green (default: 80)
     --min-ok N            Minimum percentage for yellow (default: 60)
+    --batch FILE          JSON list of badges to generate in parallel; each entry
+                          needs "output_file" and may set "coverage_file",
+                          "style", "title", "min_good" and "min_ok" (cannot be
+                          combined with --output)
 """
 
 import argparse
+import functools
+import json
+import mmap
+import os
+import re
 import xml.etree.ElementTree as ET  # nosec B405 - parsing trusted coverage.xml files only
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from urllib.parse import quote
 
+# Matches the line-rate attribute on the root <coverage> element; anchored on
+# whitespace so attributes such as x-line-rate do not match
+_LINE_RATE_RE = re.compile(rb'<coverage(?:\s[^>]*?)?\sline-rate="([0-9.]+)"')
+
+# Supported badge styles
+_STYLES = ("flat", "plastic", "for-the-badge")
+
+# Color mappings for shield.io compatible colors
+_COLOR_MAP = {
+    "brightgreen": "#4c1",
+    "green": "#97ca00",
+    "yellow": "#dfb317",
+    "orange": "#fe7d37",
+    "red": "#e05d44",
+    "lightgrey": "#9f9f9f",
+    "blue": "#007ec6",
+}
+
+# Approximate Verdana advance widths at font-size 11, in tenths of a pixel,
+# grouped as (width, characters)
+_VERDANA_11 = (
+    (30, "'il"),
+    (38, ".fj"),
+    (39, " "),
+    (40, ","),
+    (43, "-t"),
+    (46, "!I"),
+    (47, ":;r"),
+    (49, "/J\\"),
+    (50, "()[]|"),
+    (56, '"'),
+    (57, "cs"),
+    (58, "z"),
+    (60, "?"),
+    (61, "L"),
+    (63, "F"),
+    (65, "ekvxy"),
+    (66, "P"),
+    (67, "ao"),
+    (68, "TY"),
+    (69, "bdgpq"),
+    (70, "$*0123456789E_`hnu{}"),
+    (75, "ABSVXZ"),
+    (76, "K"),
+    (77, "CR"),
+    (80, "&"),
+    (81, "U"),
+    (82, "N"),
+    (83, "H"),
+    (85, "DG"),
+    (87, "OQ"),
+    (89, "w"),
+    (92, "#+<=>^~"),
+    (93, "M"),
+    (107, "m"),
+    (109, "W"),
+    (110, "@"),
+    (119, "%"),
+)
+
+# 256-entry lookup tables indexed by Latin-1 byte value, keyed by font size
+_VERDANA_11_WIDTHS = {char: width for width, chars in _VERDANA_11 for char in chars}
+_ADV_FS11 = bytes(_VERDANA_11_WIDTHS.get(chr(i), 70) for i in range(256))
+_ADV_FS12 = bytes(round(width * 12 / 11) for width in _ADV_FS11)
+_ADVANCE_WIDTHS = {11: _ADV_FS11, 12: _ADV_FS12}
+
+# SVG templates, filled in with str.format by the badge template methods
+_FLAT_SVG = """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="20" role="img" aria-label="{title}: {text}">
+    <title>{title}: {text}</title>
+    <linearGradient id="s" x2="0" y2="100%">
+        <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+        <stop offset="1" stop-opacity=".1"/>
+    </linearGradient>
+    <clipPath id="r">
+        <rect width="{total_width}" height="20" rx="3" fill="#fff"/>
+    </clipPath>
+    <g clip-path="url(#r)">
+        <rect width="{title_rect_width}" height="20" fill="#555"/>
+        <rect x="{title_rect_width}" width="{text_rect_width}" height="20" fill="{badge_color}"/>
+        <rect width="{total_width}" height="20" fill="url(#s)"/>
+    </g>
+    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
+        <text aria-hidden="true" x="{title_x}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)">{title}</text>
+        <text x="{title_x}" y="140" transform="scale(.1)" fill="#fff">{title}</text>
+        <text aria-hidden="true" x="{text_x}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)">{text}</text>
+        <text x="{text_x}" y="140" transform="scale(.1)" fill="#fff">{text}</text>
+    </g>
+</svg>"""
+
+# Similar to flat but with rounded corners and gradients
+_PLASTIC_SVG = """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="18" role="img" aria-label="{title}: {text}">
+    <title>{title}: {text}</title>
+    <linearGradient id="s" x2="0" y2="100%">
+        <stop offset="0" stop-color="#fff" stop-opacity=".7"/>
+        <stop offset=".1" stop-color="#aaa" stop-opacity=".1"/>
+        <stop offset=".9" stop-color="#000" stop-opacity=".3"/>
+        <stop offset="1" stop-color="#000" stop-opacity=".5"/>
+    </linearGradient>
+    <clipPath id="r">
+        <rect width="{total_width}" height="18" rx="4" fill="#fff"/>
+    </clipPath>
+    <g clip-path="url(#r)">
+        <rect width="{title_rect_width}" height="18" fill="#555"/>
+        <rect x="{title_rect_width}" width="{text_rect_width}" height="18" fill="{badge_color}"/>
+        <rect width="{total_width}" height="18" fill="url(#s)"/>
+    </g>
+    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
+        <text aria-hidden="true" x="{title_x}" y="140" fill="#010101" fill-opacity=".3" transform="scale(.1)">{title}</text>
+        <text x="{title_x}" y="130" transform="scale(.1)" fill="#fff">{title}</text>
+        <text aria-hidden="true" x="{text_x}" y="140" fill="#010101" fill-opacity=".3" transform="scale(.1)">{text}</text>
+        <text x="{text_x}" y="130" transform="scale(.1)" fill="#fff">{text}</text>
+    </g>
+</svg>"""
+
+_FOR_THE_BADGE_SVG = """<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="28" role="img" aria-label="{title}: {text}">
+    <title>{title}: {text}</title>
+    <g shape-rendering="crispEdges">
+        <rect width="{title_rect_width}" height="28" fill="#555"/>
+        <rect x="{title_rect_width}" width="{text_rect_width}" height="28" fill="{badge_color}"/>
+    </g>
+    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-weight="bold" font-size="100">
+        <text x="{title_x}" y="175" transform="scale(.1)" fill="#fff">{title}</text>
+        <text x="{text_x}" y="175" transform="scale(.1)" fill="#fff">{text}</text>
+    </g>
+</svg>"""
+
+
+def _calculate_text_width(text: str, font_size: int = 11) -> int:
+    """Estimate text width for SVG positioning."""
+    # Sum per-character advance widths (in tenths of a pixel); characters
+    # outside Latin-1 are measured as "?"
+    encoded = text.encode("latin-1", "replace")
+    table = _ADVANCE_WIDTHS.get(font_size)
+    if table is None:
+        return sum(map(_ADVANCE_WIDTHS[11].__getitem__, encoded)) * font_size // 110
+    return sum(map(table.__getitem__, encoded)) // 10
+
+
+@dataclass(frozen=True, slots=True)
+class BadgeText:
+    """A badge label with its uppercase form and rendered widths precomputed."""
+
+    text: str
+    upper: str
+    w11: int  # width of text at font-size 11 (flat, plastic)
+    w12: int  # width of upper at font-size 12 (for-the-badge)
+
+
+@functools.lru_cache(maxsize=128)
+def make_badge_text(text: str) -> BadgeText:
+    """Measure a badge label once so every template style can share it."""
+    upper = text.upper()
+    return BadgeText(
+        text=text,
+        upper=upper,
+        w11=_calculate_text_width(text),
+        w12=_calculate_text_width(upper, 12),
+    )
+
+
+def _flat_badge_template(title: BadgeText, text: BadgeText, color: str) -> str:
+    """Generate flat style badge SVG."""
+    # Calculate dimensions
+    title_width = title.w11
+    text_width = text.w11
+    total_width = title_width + text_width + 20  # padding
+
+    title_x = title_width // 2 + 6
+    text_x = title_width + (text_width // 2) + 10
+
+    return _FLAT_SVG.format(
+        total_width=total_width,
+        title_rect_width=title_width + 10,
+        text_rect_width=text_width + 10,
+        badge_color=_COLOR_MAP.get(color, color),
+        title=title.text,
+        text=text.text,
+        title_x=title_x * 10,
+        text_x=text_x * 10,
+    )
+
+
+def _plastic_badge_template(title: BadgeText, text: BadgeText, color: str) -> str:
+    """Generate plastic style badge SVG."""
+    title_width = title.w11
+    text_width = text.w11
+    total_width = title_width + text_width + 20
+
+    title_x = title_width // 2 + 6
+    text_x = title_width + (text_width // 2) + 10
+
+    return _PLASTIC_SVG.format(
+        total_width=total_width,
+        title_rect_width=title_width + 10,
+        text_rect_width=text_width + 10,
+        badge_color=_COLOR_MAP.get(color, color),
+        title=title.text,
+        text=text.text,
+        title_x=title_x * 10,
+        text_x=text_x * 10,
+    )
+
+
+def _for_the_badge_template(title: BadgeText, text: BadgeText, color: str) -> str:
+    """Generate for-the-badge style badge SVG."""
+    # For-the-badge uses uppercase text and larger size
+    title_width = title.w12
+    text_width = text.w12
+    total_width = title_width + text_width + 24
+
+    title_x = title_width // 2 + 8
+    text_x = title_width + (text_width // 2) + 16
+
+    return _FOR_THE_BADGE_SVG.format(
+        total_width=total_width,
+        title_rect_width=title_width + 16,
+        text_rect_width=text_width + 8,
+        badge_color=_COLOR_MAP.get(color, color),
+        title=title.upper,
+        text=text.upper,
+        title_x=title_x * 10,
+        text_x=text_x * 10,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_svg_badge(title: str, text: str, color: str, style: str) -> bytes:
+    """Generate UTF-8 encoded SVG badge content, memoized on the badge inputs."""
+    # Unknown styles fall back to flat
+    if style == "plastic":
+        template_func = _plastic_badge_template
+    elif style == "for-the-badge":
+        template_func = _for_the_badge_template
+    else:
+        template_func = _flat_badge_template
+
+    badge_svg = template_func(make_badge_text(title), make_badge_text(text), color)
+    return badge_svg.encode("utf-8")
+
+
+class BadgeSpec(NamedTuple):
+    """Parameters for one badge in a batch, mirroring generate_badge()."""
+
+    coverage_file: Path
+    output_file: Path
+    style: str = "flat"
+    title: str = "coverage"
+    min_good: int = 80
+    min_ok: int = 60
+
 
 class CoverageBadgeGenerator:
     """Generates SVG coverage badges from coverage.xml files."""
 
-    def __init__(self):
-        self.badge_templates = {
-            "flat": self._flat_badge_template,
-            "plastic": self._plastic_badge_template,
-            "for-the-badge": self._for_the_badge_template,
-        }
+    # Stateless: templates and caches live at module scope
+    __slots__ = ()
 
     def generate_badge(
         self,
@@ -54,6 +311,51 @@ class CoverageBadgeGenerator:
         # Parse coverage data
         coverage_percent = self._parse_coverage_xml(coverage_file)
 
+        self._write_badge(coverage_percent, output_file, style, title, min_good, min_ok)
+
+    def generate_badges(self, specs: Iterable[BadgeSpec]) -> None:
+        """Generate several badges, parsing each coverage file only once."""
+        for coverage_percent, spec in self._with_coverage(specs):
+            self._write_spec(coverage_percent, spec)
+
+    def _with_coverage(
+        self, specs: Iterable[BadgeSpec]
+    ) -> List[Tuple[float, BadgeSpec]]:
+        """Pair each spec with its coverage, parsing each file only once."""
+        coverage_by_file: Dict[Path, float] = {}
+        jobs = []
+
+        for spec in specs:
+            coverage_percent = coverage_by_file.get(spec.coverage_file)
+            if coverage_percent is None:
+                coverage_percent = self._parse_coverage_xml(spec.coverage_file)
+                coverage_by_file[spec.coverage_file] = coverage_percent
+
+            jobs.append((coverage_percent, spec))
+
+        return jobs
+
+    def _write_spec(self, coverage_percent: float, spec: BadgeSpec) -> None:
+        """Render and write the badge described by a spec."""
+        self._write_badge(
+            coverage_percent,
+            spec.output_file,
+            spec.style,
+            spec.title,
+            spec.min_good,
+            spec.min_ok,
+        )
+
+    def _write_badge(
+        self,
+        coverage_percent: float,
+        output_file: Path,
+        style: str,
+        title: str,
+        min_good: int,
+        min_ok: int,
+    ) -> None:
+        """Render a badge for a coverage percentage and write it to disk."""
         # Determine color based on coverage
         color = self._get_coverage_color(coverage_percent, min_good, min_ok)
 
@@ -61,10 +363,10 @@ class CoverageBadgeGenerator:
         coverage_text = f"{coverage_percent:.0f}%"
 
         # Generate SVG badge
-        svg_content = self._generate_svg_badge(title, coverage_text, color, style)
+        svg_content = _generate_svg_badge(title, coverage_text, color, style)
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
+        # Write the already encoded badge, skipping the text-mode encoder
+        with open(output_file, "wb") as f:
             f.write(svg_content)
 
         print(f"Generated coverage badge: {output_file}")
@@ -73,32 +375,58 @@ class CoverageBadgeGenerator:
     def _parse_coverage_xml(self, coverage_file: Path) -> float:
         """Parse coverage percentage from coverage.xml file."""
         try:
-            tree = ET.parse(
-                coverage_file
-            )  # nosec B314 - parsing trusted coverage.xml from pytest
-            root = tree.getroot()
-
-            # Get line-rate from the coverage element
-            line_rate = root.get("line-rate")
-            if line_rate:
-                return float(line_rate) * 100
-
-            # Fallback: calculate from package data
-            total_lines = 0
-            covered_lines = 0
-
-            for package in root.findall(".//package"):
-                package_line_rate = package.get("line-rate")
-                if package_line_rate:
-                    # This is a simplified approach; for more accuracy,
-                    # we'd need to parse individual class/method data
-                    return float(package_line_rate) * 100
+            # Fast path: the root line-rate is all we need, so avoid XML parsing
+            coverage_percent = self._scan_line_rate(coverage_file)
+            if coverage_percent is not None:
+                return coverage_percent
+
+            with open(coverage_file, "rb") as f:
+                # Stream the document instead of building the full tree; the
+                # root's attributes are available on its first start event.
+                events = ET.iterparse(
+                    f, events=("start", "end")
+                )  # nosec B314 - parsing trusted coverage.xml from pytest
+                _, root = next(events)
+
+                # Get line-rate from the coverage element
+                line_rate = root.get("line-rate")
+                if line_rate:
+                    return float(line_rate) * 100
+
+                # Fallback: calculate from package data
+                for event, elem in events:
+                    if event == "end":
+                        # Drop finished elements to keep memory bounded
+                        elem.clear()
+                        continue
+
+                    if elem.tag == "package":
+                        package_line_rate = elem.get("line-rate")
+                        if package_line_rate:
+                            # This is a simplified approach; for more accuracy,
+                            # we'd need to parse individual class/method data
+                            return float(package_line_rate) * 100
 
             raise ValueError("Could not find coverage data in XML")
 
         except (ET.ParseError, ValueError, FileNotFoundError) as e:
             raise RuntimeError(f"Error parsing coverage file {coverage_file}: {e}")
 
+    def _scan_line_rate(self, coverage_file: Path) -> Optional[float]:
+        """Scan coverage.xml for the root line-rate without parsing the XML."""
+        with open(coverage_file, "rb") as f:
+            # mmap cannot map an empty file; let the XML parser report it
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = _LINE_RATE_RE.search(mm)
+                if match is None:
+                    return None
+
+                # Read the group while the mapping is still open
+                return float(match.group(1)) * 100
+
     def _get_coverage_color(self, coverage: float, min_good: int, min_ok: int) -> str:
         """Determine badge color based on coverage percentage."""
         if coverage >= min_good:
@@ -108,150 +436,103 @@ class CoverageBadgeGenerator:
         else:
             return "red"
 
-    def _generate_svg_badge(self, title: str, text: str, color: str, style: str) -> str:
-        """Generate SVG badge content."""
-        template_func = self.badge_templates.get(style, self.badge_templates["flat"])
-        return template_func(title, text, color)
-
-    def _calculate_text_width(self, text: str, font_size: int = 11) -> int:
-        """Estimate text width for SVG positioning."""
-        # Rough approximation for text width in pixels
-        # This is a simplified calculation; real implementation would use
-        # font metrics, but this works for most cases
-        char_width = font_size * 0.6
-        return int(len(text) * char_width)
-
-    def _flat_badge_template(self, title: str, text: str, color: str) -> str:
-        """Generate flat style badge SVG."""
-        # Color mappings for shield.io compatible colors
-        color_map = {
-            "brightgreen": "#4c1",
-            "green": "#97ca00",
-            "yellow": "#dfb317",
-            "orange": "#fe7d37",
-            "red": "#e05d44",
-            "lightgrey": "#9f9f9f",
-            "blue": "#007ec6",
-        }
-
-        badge_color = color_map.get(color, color)
-
-        # Calculate dimensions
-        title_width = self._calculate_text_width(title)
-        text_width = self._calculate_text_width(text)
-        total_width = title_width + text_width + 20  # padding
-
-        title_x = title_width // 2 + 6
-        text_x = title_width + (text_width // 2) + 10
-
-        return f"""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="20" role="img" aria-label="{title}: {text}">
-    <title>{title}: {text}</title>
-    <linearGradient id="s" x2="0" y2="100%">
-        <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
-        <stop offset="1" stop-opacity=".1"/>
-    </linearGradient>
-    <clipPath id="r">
-        <rect width="{total_width}" height="20" rx="3" fill="#fff"/>
-    </clipPath>
-    <g clip-path="url(#r)">
-        <rect width="{title_width + 10}" height="20" fill="#555"/>
-        <rect x="{title_width + 10}" width="{text_width + 10}" height="20" fill="{badge_color}"/>
-        <rect width="{total_width}" height="20" fill="url(#s)"/>
-    </g>
-    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
-        <text aria-hidden="true" x="{title_x * 10}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)">{title}</text>
-        <text x="{title_x * 10}" y="140" transform="scale(.1)" fill="#fff">{title}</text>
-        <text aria-hidden="true" x="{text_x * 10}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)">{text}</text>
-        <text x="{text_x * 10}" y="140" transform="scale(.1)" fill="#fff">{text}</text>
-    </g>
-</svg>"""
 
-    def _plastic_badge_template(self, title: str, text: str, color: str) -> str:
-        """Generate plastic style badge SVG."""
-        # Similar to flat but with rounded corners and gradients
-        color_map = {
-            "brightgreen": "#4c1",
-            "green": "#97ca00",
-            "yellow": "#dfb317",
-            "orange": "#fe7d37",
-            "red": "#e05d44",
-            "lightgrey": "#9f9f9f",
-            "blue": "#007ec6",
-        }
-
-        badge_color = color_map.get(color, color)
-
-        title_width = self._calculate_text_width(title)
-        text_width = self._calculate_text_width(text)
-        total_width = title_width + text_width + 20
-
-        title_x = title_width // 2 + 6
-        text_x = title_width + (text_width // 2) + 10
-
-        return f"""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="18" role="img" aria-label="{title}: {text}">
-    <title>{title}: {text}</title>
-    <linearGradient id="s" x2="0" y2="100%">
-        <stop offset="0" stop-color="#fff" stop-opacity=".7"/>
-        <stop offset=".1" stop-color="#aaa" stop-opacity=".1"/>
-        <stop offset=".9" stop-color="#000" stop-opacity=".3"/>
-        <stop offset="1" stop-color="#000" stop-opacity=".5"/>
-    </linearGradient>
-    <clipPath id="r">
-        <rect width="{total_width}" height="18" rx="4" fill="#fff"/>
-    </clipPath>
-    <g clip-path="url(#r)">
-        <rect width="{title_width + 10}" height="18" fill="#555"/>
-        <rect x="{title_width + 10}" width="{text_width + 10}" height="18" fill="{badge_color}"/>
-        <rect width="{total_width}" height="18" fill="url(#s)"/>
-    </g>
-    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
-        <text aria-hidden="true" x="{title_x * 10}" y="140" fill="#010101" fill-opacity=".3" transform="scale(.1)">{title}</text>
-        <text x="{title_x * 10}" y="130" transform="scale(.1)" fill="#fff">{title}</text>
-        <text aria-hidden="true" x="{text_x * 10}" y="140" fill="#010101" fill-opacity=".3" transform="scale(.1)">{text}</text>
-        <text x="{text_x * 10}" y="130" transform="scale(.1)" fill="#fff">{text}</text>
-    </g>
-</svg>"""
+def _render_job(job: Tuple[float, BadgeSpec]) -> None:
+    """Render one badge from an already parsed coverage percentage."""
+    coverage_percent, spec = job
+    CoverageBadgeGenerator()._write_spec(coverage_percent, spec)
 
-    def _for_the_badge_template(self, title: str, text: str, color: str) -> str:
-        """Generate for-the-badge style badge SVG."""
-        color_map = {
-            "brightgreen": "#4c1",
-            "green": "#97ca00",
-            "yellow": "#dfb317",
-            "orange": "#fe7d37",
-            "red": "#e05d44",
-            "lightgrey": "#9f9f9f",
-            "blue": "#007ec6",
-        }
-
-        badge_color = color_map.get(color, color)
-
-        # For-the-badge uses uppercase text and larger size
-        title_upper = title.upper()
-        text_upper = text.upper()
-
-        title_width = self._calculate_text_width(title_upper, 12)
-        text_width = self._calculate_text_width(text_upper, 12)
-        total_width = title_width + text_width + 24
-
-        title_x = title_width // 2 + 8
-        text_x = title_width + (text_width // 2) + 16
-
-        return f"""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{total_width}" height="28" role="img" aria-label="{title_upper}: {text_upper}">
-    <title>{title_upper}: {text_upper}</title>
-    <g shape-rendering="crispEdges">
-        <rect width="{title_width + 16}" height="28" fill="#555"/>
-        <rect x="{title_width + 16}" width="{text_width + 8}" height="28" fill="{badge_color}"/>
-    </g>
-    <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-weight="bold" font-size="100">
-        <text x="{title_x * 10}" y="175" transform="scale(.1)" fill="#fff">{title_upper}</text>
-        <text x="{text_x * 10}" y="175" transform="scale(.1)" fill="#fff">{text_upper}</text>
-    </g>
-</svg>"""
 
+def generate_batch(specs: List[BadgeSpec], workers: Optional[int] = None) -> None:
+    """Generate badges in parallel across worker processes.
 
-def main():
-    """Main entry point for coverage badge generation."""
+    Each coverage file is parsed once up front; the workers only render and
+    write badges, so badges sharing a coverage file still run in parallel.
+
+    Args:
+        specs: Badges to generate
+        workers: Maximum number of worker processes (default: CPU count)
+    """
+    jobs = CoverageBadgeGenerator()._with_coverage(specs)
+
+    max_workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if max_workers <= 1:
+        # A pool would only add process startup cost
+        for job in jobs:
+            _render_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so worker exceptions propagate
+        list(executor.map(_render_job, jobs))
+
+
+def _load_batch_specs(
+    batch_file: Path, defaults: argparse.Namespace
+) -> List[BadgeSpec]:
+    """Load badge specs from a JSON list, filling gaps from the CLI options."""
+    with open(batch_file, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError(f"Batch file {batch_file} must contain a JSON list")
+
+    specs = []
+    for index, entry in enumerate(entries, start=1):
+        specs.append(_batch_entry_to_spec(index, entry, defaults))
+
+    return specs
+
+
+def _batch_entry_to_spec(
+    index: int, entry: object, defaults: argparse.Namespace
+) -> BadgeSpec:
+    """Validate one batch entry and convert it to a BadgeSpec."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"Batch entry {index} must be a JSON object")
+
+    unknown = sorted(set(entry) - set(BadgeSpec._fields))
+    if unknown:
+        raise ValueError(f"Batch entry {index} has unknown keys: {', '.join(unknown)}")
+
+    if "output_file" not in entry:
+        raise ValueError(f"Batch entry {index} is missing 'output_file'")
+
+    values = {
+        "coverage_file": defaults.coverage_file,
+        "style": defaults.style,
+        "title": defaults.title,
+        "min_good": defaults.min_good,
+        "min_ok": defaults.min_ok,
+        **entry,
+    }
+
+    for key in ("coverage_file", "output_file", "title"):
+        if not isinstance(values[key], (str, Path)):
+            raise ValueError(f"Batch entry {index}: '{key}' must be a string")
+
+    if values["style"] not in _STYLES:
+        raise ValueError(
+            f"Batch entry {index}: 'style' must be one of {', '.join(_STYLES)}"
+        )
+
+    for key in ("min_good", "min_ok"):
+        # bool is an int subclass, but true/false is never a valid threshold
+        if not isinstance(values[key], int) or isinstance(values[key], bool):
+            raise ValueError(f"Batch entry {index}: '{key}' must be an integer")
+
+    return BadgeSpec(
+        coverage_file=Path(values["coverage_file"]),
+        output_file=Path(values["output_file"]),
+        style=values["style"],
+        title=values["title"],
+        min_good=values["min_good"],
+        min_ok=values["min_ok"],
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for coverage badge generation."""
     parser = argparse.ArgumentParser(
         description="Generate SVG coverage badges from coverage.xml files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -267,13 +548,13 @@ def main():
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("coverage-badge.svg"),
-        help="Output SVG file path (default: coverage-badge.svg)",
+        help="Output SVG file path (default: coverage-badge.svg); not used with "
+        "--batch",
     )
 
     parser.add_argument(
         "--style",
-        choices=["flat", "plastic", "for-the-badge"],
+        choices=_STYLES,
         default="flat",
         help="Badge style (default: flat)",
     )
@@ -298,9 +579,41 @@ def main():
         help="Minimum percentage for yellow color (default: 60)",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="JSON file listing badges to generate in parallel",
+    )
+
+    return parser
+
+
+# Built on first use by main() and reused by later calls
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def main():
+    """Main entry point for coverage badge generation."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+
+    args = _PARSER.parse_args()
+
+    if args.batch and args.output is not None:
+        _PARSER.error("--output cannot be used with --batch; set output_file per entry")
+
+    if args.output is None:
+        args.output = Path("coverage-badge.svg")
 
     try:
+        if args.batch:
+            specs = _load_batch_specs(args.batch, args)
+            generate_batch(specs)
+
+            print(f"\n✅ Generated {len(specs)} coverage badges!")
+            return 0
+
         generator = CoverageBadgeGenerator()
         generator.generate_badge(
             coverage_file=args.coverage_file,
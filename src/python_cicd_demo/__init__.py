@@ -5,6 +5,23 @@ A comprehensive demonstration of modern Python development and CI/CD practices.
 
 __version__ = "0.1.0"
 
-from .main import add, calculate, subtract
+from .main import (
+    add,
+    calculate,
+    calculate_add,
+    calculate_sub,
+    configure,
+    get_operation,
+    subtract,
+)
 
-__all__ = ["add", "subtract", "calculate", "__version__"]
+__all__ = [
+    "add",
+    "subtract",
+    "calculate",
+    "calculate_add",
+    "calculate_sub",
+    "get_operation",
+    "configure",
+    "__version__",
+]
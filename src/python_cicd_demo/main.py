@@ -4,13 +4,9 @@ This module contains simple mathematical functions to demonstrate
 testing, documentation, and CI/CD practices.
 """
 
+import operator
 import os
-from typing import Union
-
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from typing import Callable, Dict, Union
 
 
 def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
@@ -23,6 +19,10 @@ def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     Returns:
         The sum of a and b
 
+    Note:
+        NumPy arrays are added elementwise without a Python-level loop, since
+        ``+`` already dispatches to the ``numpy.add`` ufunc.
+
     Examples:
         >>> add(2, 3)
         5
@@ -42,6 +42,10 @@ def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     Returns:
         The difference of a and b
 
+    Note:
+        NumPy arrays are subtracted elementwise without a Python-level loop,
+        since ``-`` already dispatches to the ``numpy.subtract`` ufunc.
+
     Examples:
         >>> subtract(5, 3)
         2
@@ -51,6 +55,23 @@ def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     return a - b
 
 
+# Environment variable values treated as "on"
+_TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes", "on"})
+
+# Supported operations for calculate(), built once at import time. The C
+# implementations from the operator module behave like add() and subtract()
+# but skip a Python frame per call.
+_OPS: Dict[str, Callable[[Union[int, float], Union[int, float]], Union[int, float]]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+}
+
+# Direct aliases for callers that want to skip calculate()'s dispatch; they
+# are the same C functions calculate() dispatches to
+calculate_add = _OPS["add"]
+calculate_sub = _OPS["subtract"]
+
+
 def calculate(
     operation: str, a: Union[int, float], b: Union[int, float]
 ) -> Union[int, float]:
@@ -73,16 +94,58 @@ def calculate(
         >>> calculate('subtract', 5, 3)
         2
     """
-    operations = {"add": add, "subtract": subtract}
+    op = _OPS.get(operation)
+    if op is None:
+        raise ValueError(f"Unsupported operation: {operation}")
+
+    return op(a, b)
+
+
+def get_operation(
+    operation: str,
+) -> Callable[[Union[int, float], Union[int, float]], Union[int, float]]:
+    """Look up the function behind a calculate() operation string.
+
+    Resolving the operation once lets tight loops call the function directly
+    instead of paying calculate()'s string dispatch on every iteration.
+
+    Args:
+        operation: The operation to look up ('add' or 'subtract')
+
+    Returns:
+        The function implementing the operation
 
-    if operation not in operations:
+    Raises:
+        ValueError: If operation is not supported
+
+    Examples:
+        >>> op = get_operation('add')
+        >>> [op(x, 1) for x in range(3)]
+        [1, 2, 3]
+    """
+    op = _OPS.get(operation)
+    if op is None:
         raise ValueError(f"Unsupported operation: {operation}")
 
-    return operations[operation](a, b)
+    return op
+
+
+def configure() -> None:
+    """Load environment variables from a ``.env`` file.
+
+    Importing the package has no side effects; library consumers that want
+    ``.env`` support call this explicitly. :func:`main` calls it on startup.
+    """
+    # Imported here so that importing the package does not load dotenv
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 def main():
     """Main function for demonstration purposes."""
+    configure()
+
     print("Python CI/CD Demo")
     print("=================")
 
@@ -94,7 +157,7 @@ def main():
     print(f"10 - 3 = {result2}")
 
     # Use environment variable if available
-    debug_mode = os.getenv("DEBUG", "false").lower() == "true"
+    debug_mode = os.environ.get("DEBUG", "") in _TRUTHY
     if debug_mode:
         print("Debug mode is enabled")
 
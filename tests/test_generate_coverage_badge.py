@@ -0,0 +1,370 @@
+"""Test module for the coverage badge generator script
+
+Tests for scripts/generate_coverage_badge.py, which is not part of the package.
+"""
+
+import importlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+badge = importlib.import_module("generate_coverage_badge")
+
+
+@pytest.fixture
+def generator():
+    """Provide a fresh badge generator."""
+    return badge.CoverageBadgeGenerator()
+
+
+def write_xml(tmp_path, content, name="coverage.xml"):
+    """Write a coverage.xml file and return its path."""
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestCalculateTextWidth:
+    """Test cases for Verdana text width estimation."""
+
+    def test_font_size_11(self):
+        """Test summing the size-11 advance widths."""
+        # c o v e r a g e = 57+67+65+65+47+67+69+65 tenths of a pixel
+        assert badge._calculate_text_width("coverage") == 50
+        assert badge._calculate_text_width("coverage", 11) == 50
+
+    def test_font_size_12(self):
+        """Test summing the size-12 advance widths."""
+        # Each size-11 width scaled by 12/11 and rounded: 547 tenths
+        assert badge._calculate_text_width("coverage", 12) == 54
+
+    def test_other_font_size_scales_size_11(self):
+        """Test that sizes without a table scale the size-11 widths."""
+        # 502 tenths at size 11, scaled by 13/11
+        assert badge._calculate_text_width("coverage", 13) == 502 * 13 // 110
+
+    def test_empty_text(self):
+        """Test that empty text has no width."""
+        assert badge._calculate_text_width("") == 0
+
+    def test_non_latin1_measured_as_question_mark(self):
+        """Test that characters outside Latin-1 are measured as '?'."""
+        assert badge._calculate_text_width("\u2713") == 6
+        assert badge._calculate_text_width("a\u2713b") == (
+            badge._calculate_text_width("a?b")
+        )
+
+
+class TestBadgeText:
+    """Test cases for precomputed badge labels."""
+
+    def test_make_badge_text(self):
+        """Test that labels carry their uppercase form and both widths."""
+        text = badge.make_badge_text("coverage")
+        assert text == badge.BadgeText(
+            text="coverage",
+            upper="COVERAGE",
+            w11=badge._calculate_text_width("coverage"),
+            w12=badge._calculate_text_width("COVERAGE", 12),
+        )
+
+    def test_make_badge_text_is_shared(self):
+        """Test that the same label is measured once and reused."""
+        assert badge.make_badge_text("coverage") is badge.make_badge_text("coverage")
+
+    def test_badge_text_is_immutable(self):
+        """Test that shared labels cannot be modified."""
+        text = badge.make_badge_text("coverage")
+        with pytest.raises(AttributeError):
+            text.upper = "changed"
+
+
+class TestGenerateSvgBadge:
+    """Test cases for rendering badges in each style."""
+
+    # coverage: w11=50, w12=67; 64%: w11=25, w12=28
+
+    @pytest.mark.parametrize(
+        "style, height, total_width",
+        [("flat", 20, 50 + 25 + 20), ("plastic", 18, 50 + 25 + 20)],
+    )
+    def test_original_case_styles(self, style, height, total_width):
+        """Test that flat and plastic keep the label case and size-11 widths."""
+        svg = badge._generate_svg_badge("coverage", "64%", "yellow", style).decode()
+        assert f'width="{total_width}" height="{height}"' in svg
+        assert "<title>coverage: 64%</title>" in svg
+        assert "COVERAGE" not in svg
+        assert 'fill="#dfb317"' in svg
+
+    def test_for_the_badge(self):
+        """Test that for-the-badge uses uppercase labels and size-12 widths."""
+        svg = badge._generate_svg_badge("coverage", "64%", "red", "for-the-badge")
+        svg = svg.decode()
+        assert f'width="{67 + 28 + 24}" height="28"' in svg
+        assert "<title>COVERAGE: 64%</title>" in svg
+        assert ">coverage<" not in svg
+        assert 'fill="#e05d44"' in svg
+
+    def test_unknown_style_falls_back_to_flat(self):
+        """Test that unknown styles render as flat."""
+        assert badge._generate_svg_badge(
+            "coverage", "64%", "yellow", "neon"
+        ) == badge._generate_svg_badge("coverage", "64%", "yellow", "flat")
+
+
+class TestParseCoverageXml:
+    """Test cases for reading coverage percentages from coverage.xml."""
+
+    def test_root_line_rate(self, generator, tmp_path):
+        """Test reading line-rate from the root coverage element."""
+        path = write_xml(
+            tmp_path,
+            '<?xml version="1.0" ?>\n'
+            '<coverage version="7.0" line-rate="0.8125" branch-rate="0">'
+            '<packages><package line-rate="0.5"/></packages></coverage>',
+        )
+        assert generator._scan_line_rate(path) == pytest.approx(81.25)
+        assert generator._parse_coverage_xml(path) == pytest.approx(81.25)
+
+    @pytest.mark.parametrize(
+        "attributes",
+        [
+            'line-rate="0.9" x-line-rate="0.1"',
+            'x-line-rate="0.1" line-rate="0.9"',
+            'version="7.0"\n    line-rate="0.9"',
+        ],
+    )
+    def test_root_line_rate_ignores_similar_attributes(
+        self, generator, tmp_path, attributes
+    ):
+        """Test that only the exact line-rate attribute is read."""
+        path = write_xml(tmp_path, f"<coverage {attributes}/>")
+        assert generator._scan_line_rate(path) == pytest.approx(90.0)
+
+    def test_package_line_rate_fallback(self, generator, tmp_path):
+        """Test falling back to the first package line-rate."""
+        path = write_xml(
+            tmp_path,
+            "<coverage><packages>"
+            '<package name="a"/><package name="b" line-rate="0.5"/>'
+            "</packages></coverage>",
+        )
+        assert generator._scan_line_rate(path) is None
+        assert generator._parse_coverage_xml(path) == pytest.approx(50.0)
+
+    def test_no_coverage_data(self, generator, tmp_path):
+        """Test a coverage.xml without any line-rate."""
+        path = write_xml(tmp_path, "<coverage><packages/></coverage>")
+        with pytest.raises(RuntimeError, match="Could not find coverage data"):
+            generator._parse_coverage_xml(path)
+
+    def test_empty_file(self, generator, tmp_path):
+        """Test that an empty file reports an XML error, not an mmap error."""
+        path = write_xml(tmp_path, "")
+        with pytest.raises(RuntimeError, match="no element found"):
+            generator._parse_coverage_xml(path)
+
+    def test_missing_file(self, generator, tmp_path):
+        """Test a coverage.xml that does not exist."""
+        with pytest.raises(RuntimeError, match="No such file or directory"):
+            generator._parse_coverage_xml(tmp_path / "missing.xml")
+
+    @pytest.mark.parametrize("line_rate", ["1.2.3", "abc"])
+    def test_malformed_line_rate(self, generator, tmp_path, line_rate):
+        """Test a root line-rate that is not a number."""
+        path = write_xml(tmp_path, f'<coverage line-rate="{line_rate}"/>')
+        with pytest.raises(RuntimeError, match="Error parsing coverage file"):
+            generator._parse_coverage_xml(path)
+
+
+class TestGenerateBadges:
+    """Test cases for generating several badges in one process."""
+
+    def test_shared_coverage_file_parsed_once(self, generator, tmp_path, monkeypatch):
+        """Test that badges sharing a coverage file parse it once."""
+        coverage = write_xml(tmp_path, '<coverage line-rate="0.85"/>')
+        specs = [
+            badge.BadgeSpec(coverage, tmp_path / "flat.svg"),
+            badge.BadgeSpec(coverage, tmp_path / "large.svg", style="for-the-badge"),
+        ]
+
+        parsed = []
+        parse = badge.CoverageBadgeGenerator._parse_coverage_xml
+
+        def counting_parse(self, coverage_file):
+            parsed.append(coverage_file)
+            return parse(self, coverage_file)
+
+        monkeypatch.setattr(
+            badge.CoverageBadgeGenerator, "_parse_coverage_xml", counting_parse
+        )
+
+        generator.generate_badges(specs)
+
+        assert parsed == [coverage]
+        assert b"<title>coverage: 85%</title>" in (tmp_path / "flat.svg").read_bytes()
+        assert b"<title>COVERAGE: 85%</title>" in (tmp_path / "large.svg").read_bytes()
+
+
+class TestBatch:
+    """Test cases for parallel batch badge generation."""
+
+    def test_generate_batch_writes_badges(self, tmp_path):
+        """Test generating several badges in worker processes."""
+        coverage = write_xml(tmp_path, '<coverage line-rate="0.9"/>')
+        specs = [
+            badge.BadgeSpec(coverage, tmp_path / f"{style}.svg", style=style)
+            for style in ("flat", "plastic", "for-the-badge")
+        ]
+
+        badge.generate_batch(specs, workers=2)
+
+        for spec in specs:
+            assert b"90%" in spec.output_file.read_bytes()
+
+    def test_generate_batch_spreads_one_file_across_workers(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that badges from one coverage file are rendered in parallel."""
+        coverage = write_xml(tmp_path, '<coverage line-rate="0.9"/>')
+        specs = [
+            badge.BadgeSpec(coverage, tmp_path / f"{style}.svg", style=style)
+            for style in ("flat", "plastic", "for-the-badge")
+        ]
+        pools = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                super().__init__(max_workers=max_workers)
+                self.jobs = []
+                pools.append(self)
+
+            def map(self, fn, jobs):
+                self.jobs = list(jobs)
+                return super().map(fn, self.jobs)
+
+        monkeypatch.setattr(badge, "ProcessPoolExecutor", RecordingExecutor)
+
+        badge.generate_batch(specs, workers=2)
+
+        [pool] = pools
+        assert pool._max_workers == 2
+        assert [spec for _, spec in pool.jobs] == specs
+        for spec in specs:
+            assert b"90%" in spec.output_file.read_bytes()
+
+    def test_generate_batch_single_worker_renders_in_process(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that a single worker skips the process pool."""
+        coverage = write_xml(tmp_path, '<coverage line-rate="0.9"/>')
+        specs = [
+            badge.BadgeSpec(coverage, tmp_path / "a.svg"),
+            badge.BadgeSpec(coverage, tmp_path / "b.svg"),
+        ]
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not be started")
+
+        monkeypatch.setattr(badge, "ProcessPoolExecutor", no_pool)
+
+        badge.generate_batch(specs, workers=1)
+        badge.generate_batch(specs[:1])
+
+        assert b"90%" in (tmp_path / "b.svg").read_bytes()
+
+    def test_generate_batch_parses_each_file_once(self, tmp_path, monkeypatch):
+        """Test that badges sharing a coverage file share one parse."""
+        first = write_xml(tmp_path, '<coverage line-rate="0.9"/>', "first.xml")
+        second = write_xml(tmp_path, '<coverage line-rate="0.5"/>', "second.xml")
+        specs = [
+            badge.BadgeSpec(first, tmp_path / "a.svg"),
+            badge.BadgeSpec(second, tmp_path / "b.svg"),
+            badge.BadgeSpec(first, tmp_path / "c.svg", style="plastic"),
+        ]
+
+        parsed = []
+        parse = badge.CoverageBadgeGenerator._parse_coverage_xml
+
+        def counting_parse(self, coverage_file):
+            parsed.append(coverage_file)
+            return parse(self, coverage_file)
+
+        # Run workers in-process so the parse calls can be counted
+        monkeypatch.setattr(badge, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(
+            badge.CoverageBadgeGenerator, "_parse_coverage_xml", counting_parse
+        )
+
+        badge.generate_batch(specs)
+
+        assert sorted(parsed) == [first, second]
+        assert b"50%" in (tmp_path / "b.svg").read_bytes()
+
+    def test_batch_cli(self, tmp_path, monkeypatch):
+        """Test the --batch command line option."""
+        coverage = write_xml(tmp_path, '<coverage line-rate="0.7"/>')
+        batch_file = tmp_path / "batch.json"
+        batch_file.write_text(
+            json.dumps(
+                [
+                    {"output_file": str(tmp_path / "flat.svg")},
+                    {"output_file": str(tmp_path / "plastic.svg"), "style": "plastic"},
+                ]
+            ),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["generate_coverage_badge.py", "--coverage-file", str(coverage)]
+            + ["--batch", str(batch_file)],
+        )
+
+        assert badge.main() == 0
+        assert b"70%" in (tmp_path / "flat.svg").read_bytes()
+        assert b"70%" in (tmp_path / "plastic.svg").read_bytes()
+
+    @pytest.mark.parametrize(
+        "entries, message",
+        [
+            ({}, "must contain a JSON list"),
+            ([1], "Batch entry 1 must be a JSON object"),
+            ([{"style": "flat"}], "Batch entry 1 is missing 'output_file'"),
+            ([{"output_file": "a.svg", "ouput": 1}], "unknown keys: ouput"),
+            ([{"output_file": "a.svg", "style": "neon"}], "'style' must be one of"),
+            ([{"output_file": "a.svg", "min_ok": "60"}], "'min_ok' must be an"),
+            ([{"output_file": "a.svg", "min_good": True}], "'min_good' must be an"),
+        ],
+    )
+    def test_batch_cli_invalid_entries(
+        self, tmp_path, monkeypatch, capsys, entries, message
+    ):
+        """Test that invalid batch entries are reported by index."""
+        batch_file = tmp_path / "batch.json"
+        batch_file.write_text(json.dumps(entries), encoding="utf-8")
+        monkeypatch.setattr(
+            sys, "argv", ["generate_coverage_badge.py", "--batch", str(batch_file)]
+        )
+
+        assert badge.main() == 1
+        assert message in capsys.readouterr().out
+
+    def test_batch_cli_rejects_output(self, tmp_path, monkeypatch, capsys):
+        """Test that --output cannot be combined with --batch."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["generate_coverage_badge.py", "--batch", str(tmp_path / "b.json")]
+            + ["--output", str(tmp_path / "x.svg")],
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            badge.main()
+
+        assert excinfo.value.code == 2
+        assert "--output cannot be used with --batch" in capsys.readouterr().err
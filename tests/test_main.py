@@ -5,7 +5,16 @@ Comprehensive tests for the main module functions.
 
 import pytest
 
-from python_cicd_demo.main import add, calculate, subtract
+from python_cicd_demo.main import (
+    add,
+    calculate,
+    calculate_add,
+    calculate_sub,
+    configure,
+    get_operation,
+    main,
+    subtract,
+)
 
 
 class TestAdd:
@@ -85,6 +94,61 @@ class TestCalculate:
         assert calculate("add", 1.5, 2.5) == pytest.approx(4.0)
         assert calculate("subtract", 5.5, 2.5) == pytest.approx(3.0)
 
+    def test_calculate_aliases(self):
+        """Test the direct calculate aliases match calculate dispatch."""
+        assert calculate_add(2, 3) == calculate("add", 2, 3)
+        assert calculate_sub(5, 3) == calculate("subtract", 5, 3)
+
+
+class TestGetOperation:
+    """Test cases for the get_operation function."""
+
+    def test_get_operation_returns_function(self):
+        """Test resolving operation strings to functions."""
+        assert get_operation("add") is calculate_add
+        assert get_operation("subtract") is calculate_sub
+        assert get_operation("add")(2, 3) == add(2, 3)
+        assert get_operation("subtract")(5, 3) == subtract(5, 3)
+
+    def test_get_operation_invalid_operation(self):
+        """Test get_operation with invalid operation."""
+        with pytest.raises(ValueError, match="Unsupported operation: multiply"):
+            get_operation("multiply")
+
+
+class TestConfigure:
+    """Test cases for the configure function."""
+
+    def test_configure_loads_dotenv(self, monkeypatch):
+        """Test that configure loads the .env file via python-dotenv."""
+        calls = []
+        monkeypatch.setattr("dotenv.load_dotenv", lambda: calls.append(True))
+        configure()
+        assert calls == [True]
+
+
+class TestMain:
+    """Test cases for the main function."""
+
+    @pytest.fixture(autouse=True)
+    def no_dotenv(self, monkeypatch):
+        """Keep main() from loading a real .env into os.environ."""
+        monkeypatch.setattr("python_cicd_demo.main.configure", lambda: None)
+
+    @pytest.mark.parametrize("value", ["1", "true", "TRUE", "yes", "on"])
+    def test_main_debug_enabled(self, monkeypatch, capsys, value):
+        """Test that truthy DEBUG values enable debug mode."""
+        monkeypatch.setenv("DEBUG", value)
+        main()
+        assert "Debug mode is enabled" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("value", ["", "0", "false", "no"])
+    def test_main_debug_disabled(self, monkeypatch, capsys, value):
+        """Test that other DEBUG values leave debug mode off."""
+        monkeypatch.setenv("DEBUG", value)
+        main()
+        assert "Debug mode is enabled" not in capsys.readouterr().out
+
 
 # Integration tests
 class TestIntegration: